@@ -1,23 +1,39 @@
-from sklearn.cluster import KMeans
-import pandas as pd
-from sklearn.preprocessing import StandardScaler
+from sklearn.cluster import MiniBatchKMeans
+import numpy as np
 
-def segment_customers(df):
-    df = df.copy()
-    df["spent_per_night"] = df["total_spent"] / df["nights"]
-    features = df[["nights", "total_spent", "spent_per_night"]]
-    scaled = StandardScaler().fit_transform(features)
-    kmeans = KMeans(n_clusters=3, random_state=42).fit(scaled)
+def segment_customers(df, k=3):
+    # Build the feature matrix from the precomputed columns without copying df
+    nights = df["nights"].to_numpy()
+    spent = df["total_spent"].to_numpy()
+    spent_per_night = df["spent_per_night"].to_numpy()
+    # float32 halves the bytes KMeans streams through on each pass; C order is what
+    # MiniBatchKMeans validates against, so no extra copy is made on fit
+    features = np.empty((len(nights), 3), dtype=np.float32)
+    features[:, 0] = nights
+    features[:, 1] = spent
+    features[:, 2] = spent_per_night
+    # Standardize in place: features is a fresh array and is not reused
+    mu = features.mean(axis=0)
+    sigma = features.std(axis=0)
+    sigma[sigma == 0] = 1.0
+    np.subtract(features, mu, out=features)
+    np.divide(features, sigma, out=features)
+    scaled = features
+    kmeans = MiniBatchKMeans(n_clusters=k, batch_size=1024, n_init=3, random_state=42).fit(scaled)
     labels = kmeans.labels_
-    # Explain segmentation
+    # Explain segmentation: per-segment sums in one bincount pass per feature
+    counts = np.bincount(labels, minlength=k)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.stack([
+            np.bincount(labels, weights=nights, minlength=k),
+            np.bincount(labels, weights=spent, minlength=k),
+            np.bincount(labels, weights=spent_per_night, minlength=k),
+        ]) / counts
     explanation = []
-    for i in range(3):
-        group = df[labels == i]
-        avg_nights = group["nights"].mean()
-        avg_spent = group["total_spent"].mean()
-        avg_spent_per_night = group["spent_per_night"].mean()
+    for i in range(k):
+        avg_nights, avg_spent, avg_spent_per_night = means[:, i]
         explanation.append(
-            f"Segment {i}: avg nights = {avg_nights:.2f}, avg spent = {avg_spent:.2f}, avg spent/night = {avg_spent_per_night:.2f}, count = {len(group)}"
+            f"Segment {i}: avg nights = {avg_nights:.2f}, avg spent = {avg_spent:.2f}, avg spent/night = {avg_spent_per_night:.2f}, count = {counts[i]}"
         )
     print("Segmentation explanation:")
     for exp in explanation:
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from sentiment_model import analyze_sentiments
 from clustering import segment_customers
 from summarizer import generate_summary
@@ -11,6 +12,7 @@ from visualizations import (
     create_booking_patterns_charts,
     create_interactive_filters,
     create_summary_insights,
+    nights_distribution,
     apply_custom_css
 )
 import os
@@ -26,14 +28,72 @@ st.set_page_config(
 # Apply custom CSS
 apply_custom_css()
 
+# Background colors for the sentiment column of the detailed results table
+SENTIMENT_CELL_STYLES = {
+    'POSITIVE': 'background-color: #e8f5e8',
+    'NEGATIVE': 'background-color: #ffe8e8',
+}
+
 # Load data
+def read_table(data_path, name, csv_dtypes):
+    """Read data/<name>.parquet if it exists, otherwise fall back to the CSV file."""
+    parquet_path = os.path.join(data_path, f"{name}.parquet")
+    if os.path.exists(parquet_path):
+        # Parquet keeps the dtypes written by data_generator.py
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    return pd.read_csv(os.path.join(data_path, f"{name}.csv"), engine="pyarrow", dtype=csv_dtypes)
+
+def narrow_whole(series, dtype="int32"):
+    """Downcast a float column to an integer dtype only if every value is present, whole and in range."""
+    values = series.to_numpy()
+    info = np.iinfo(dtype)
+    if len(values) and not (
+        series.notna().all()
+        and (values % 1 == 0).all()
+        and values.min() >= info.min
+        and values.max() <= info.max
+    ):
+        return series
+    return series.astype(dtype)
+
 @st.cache_data
 def load_data():
     data_path = os.path.join(os.path.dirname(__file__), '..', 'data')
-    df_reviews = pd.read_csv(os.path.join(data_path, "reviews.csv"))
-    df_bookings = pd.read_csv(os.path.join(data_path, "bookings.csv"))
+    df_reviews = read_table(data_path, "reviews", {"sentiment": "category"})
+    df_bookings = read_table(
+        data_path,
+        "bookings",
+        {
+            # Numeric columns are read as float so fractional or blank cells survive;
+            # they are narrowed to integers below only when that is lossless
+            "customer_id": "float64",
+            "nights": "float64",
+            "total_spent": "float64",
+            "price_per_night": "float64",
+            "segment": "category",
+        }
+    )
+    for col in ["customer_id", "nights", "total_spent"]:
+        df_bookings[col] = narrow_whole(df_bookings[col])
+    # Derived feature shared by segmentation and the AI summary
+    df_bookings["spent_per_night"] = df_bookings["total_spent"] / df_bookings["nights"].replace(0, np.nan)
     return df_reviews, df_bookings
 
+# Cache model outputs so page switches and widget changes don't re-run them
+@st.cache_data(show_spinner=False)
+def cached_sentiments(reviews):
+    return analyze_sentiments(reviews)
+
+@st.cache_data(show_spinner=False)
+def cached_segments(features):
+    segments = segment_customers(features)
+    if isinstance(segments, tuple):
+        segments = segments[0]
+    return segments
+
+# Columns segment_customers reads; keying the cache on them alone ignores the existing segment labels
+SEGMENT_FEATURES = ["nights", "total_spent", "spent_per_night"]
+
 df_reviews, df_bookings = load_data()
 
 # Main header with gradient background
@@ -74,7 +134,7 @@ if page == "📊 Overview Dashboard":
     
     with col2:
         # Nights distribution
-        nights_dist = df_bookings['nights'].value_counts().sort_index()
+        nights_dist = nights_distribution(df_bookings['nights'])
         st.bar_chart(nights_dist)
         st.caption("Distribution of Booking Durations")
 
@@ -84,8 +144,7 @@ elif page == "📝 Sentiment Analysis":
     
     # Run sentiment analysis
     with st.spinner("Analyzing customer sentiments..."):
-        sentiments = analyze_sentiments(df_reviews["review"])
-        df_reviews["sentiment"] = sentiments
+        df_reviews["sentiment"] = cached_sentiments(df_reviews["review"])
     
     # Create sentiment charts
     create_sentiment_analysis_charts(df_reviews)
@@ -93,10 +152,8 @@ elif page == "📝 Sentiment Analysis":
     # Detailed sentiment table
     st.markdown("### 📋 Detailed Sentiment Results")
     st.dataframe(
-        df_reviews[['review', 'sentiment']].style.apply(
-            lambda x: ['background-color: #e8f5e8' if v == 'POSITIVE' 
-                      else 'background-color: #ffe8e8' if v == 'NEGATIVE' 
-                      else 'background-color: #fff8e8' for v in x], 
+        df_reviews[['review', 'sentiment']].style.map(
+            lambda v: SENTIMENT_CELL_STYLES.get(v, 'background-color: #fff8e8'),
             subset=['sentiment']
         ),
         use_container_width=True
@@ -108,18 +165,18 @@ elif page == "👥 Customer Segmentation":
     
     # Run customer segmentation
     with st.spinner("Segmenting customers..."):
-        segments = segment_customers(df_bookings)
-        if isinstance(segments, tuple):
-            segments = segments[0]
-        df_bookings["segment"] = segments
+        df_bookings["segment"] = cached_segments(df_bookings[SEGMENT_FEATURES])
     
     # Create segmentation charts
     create_customer_segmentation_charts(df_bookings)
     
     # Customer details table
     st.markdown("### 👤 Customer Details by Segment")
+    # Project the displayed columns first, then reorder with a stable argsort
+    detail_cols = ['customer_id', 'nights', 'total_spent', 'segment']
+    order = np.argsort(df_bookings['segment'].to_numpy(), kind='stable')
     st.dataframe(
-        df_bookings.sort_values('segment')[['customer_id', 'nights', 'total_spent', 'segment']],
+        df_bookings[detail_cols].iloc[order],
         use_container_width=True
     )
 
@@ -166,15 +223,15 @@ elif page == "🤖 AI Summary":
     st.header("🤖 AI-Powered Business Summary")
     st.markdown("Get intelligent insights and recommendations from your data")
     
-    # Check if sentiment analysis has been performed, if not, run it
-    if 'sentiment' not in df_reviews.columns:
-        with st.spinner("Running sentiment analysis for comprehensive insights..."):
-            from sentiment_model import analyze_sentiments
-            sentiments = analyze_sentiments(df_reviews["review"])
-            df_reviews["sentiment"] = sentiments
+    # Sentiment and segmentation both feed the summary; cached after the first run
+    with st.spinner("Running sentiment analysis and segmentation for comprehensive insights..."):
+        df_reviews["sentiment"] = cached_sentiments(df_reviews["review"])
+        df_bookings["segment"] = cached_segments(df_bookings[SEGMENT_FEATURES])
     
     # Generate AI summary
     with st.spinner("Generating AI summary..."):
+        # Not cached here: generate_summary memoizes model output per prompt, and
+        # caching its manual fallback would pin a transient model failure
         summary = generate_summary(df_reviews, df_bookings)
     
     # Display summary in a nice format
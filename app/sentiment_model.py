@@ -1,10 +1,43 @@
-from transformers import pipeline
-def analyze_sentiments(reviews):
-    # Specify model and revision explicitly for production use
-    classifier = pipeline(
+import streamlit as st
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+from onnx_models import load_onnx_model
+
+# Specify model and revision explicitly for production use
+MODEL_NAME = "distilbert/distilbert-base-uncased-finetuned-sst-2-english"
+MODEL_REVISION = "714eb0f"
+# Reviews longer than this are cut before tokenization; max_length truncates anyway
+MAX_REVIEW_CHARS = 1000
+
+@st.cache_resource(show_spinner=False)
+def _get_classifier():
+    """Load the sentiment pipeline once and share it across reruns and sessions."""
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, revision=MODEL_REVISION)
+    # Prefer the fused ONNX Runtime graph when optimum is installed
+    model = load_onnx_model("sentiment-analysis", MODEL_NAME, revision=MODEL_REVISION)
+    if model is None:
+        model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME, revision=MODEL_REVISION)
+        # Dynamic int8 quantization of the Linear layers for faster CPU inference
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline(
         "sentiment-analysis",
-        model="distilbert/distilbert-base-uncased-finetuned-sst-2-english",
-        revision="714eb0f",
+        model=model,
+        tokenizer=tokenizer,
         device=-1  # Use CPU
     )
-    return [result["label"] for result in classifier(reviews.tolist())]
\ No newline at end of file
+
+def analyze_sentiments(reviews, batch_size=32):
+    classifier = _get_classifier()
+    texts = [review[:MAX_REVIEW_CHARS] for review in reviews.astype(str).tolist()]
+    # Sort by length so each batch pads to similar sizes, then restore order
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    results = classifier(
+        [texts[i] for i in order],
+        batch_size=batch_size,
+        truncation=True,
+        max_length=128
+    )
+    labels = [None] * len(texts)
+    for i, result in zip(order, results):
+        labels[i] = result["label"]
+    return labels
\ No newline at end of file
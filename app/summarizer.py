@@ -1,6 +1,29 @@
-from transformers import pipeline
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 import pandas as pd
 import streamlit as st
+import torch
+from onnx_models import load_onnx_model
+
+SUMMARY_MODEL = "sshleifer/distilbart-cnn-6-6"
+
+@st.cache_resource(show_spinner=False)
+def _get_summarizer():
+    """Load the summarization pipeline once and share it across reruns."""
+    tokenizer = AutoTokenizer.from_pretrained(SUMMARY_MODEL)
+    # Prefer the fused ONNX Runtime graph when optimum is installed
+    model = load_onnx_model("summarization", SUMMARY_MODEL)
+    if model is None:
+        model = AutoModelForSeq2SeqLM.from_pretrained(SUMMARY_MODEL)
+        # Dynamic int8 quantization of the Linear layers for faster CPU inference
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline("summarization", model=model, tokenizer=tokenizer, device=-1)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _summarize(prompt):
+    """Summarize a prompt, reusing the result when the same prompt comes back."""
+    summary_pipe = _get_summarizer()
+    summary_result = summary_pipe(prompt, max_length=80, min_length=20, num_beams=1, do_sample=False)
+    return summary_result[0]['summary_text']
 
 def generate_summary(df_reviews, df_bookings):
     """
@@ -23,6 +46,7 @@ def generate_summary(df_reviews, df_bookings):
         
         # Handle segment information if available
         segment_info = ""
+        segment_counts = None
         if "segment" in df_bookings.columns:
             segment_counts = df_bookings["segment"].value_counts().to_dict()
             segment_info = f"Customer segments: {segment_counts}. "
@@ -67,9 +91,7 @@ def generate_summary(df_reviews, df_bookings):
         # Try to use the AI model for summarization
         try:
             # Check if transformers is available and model can be loaded
-            summary_pipe = pipeline("summarization", model="facebook/bart-large-cnn")
-            summary_result = summary_pipe(prompt, max_length=150, min_length=50, do_sample=False)
-            summary = summary_result[0]['summary_text']
+            summary = _summarize(prompt)
             
             # Ensure the summary is not empty
             if not summary or len(summary.strip()) < 10:
@@ -78,7 +100,7 @@ def generate_summary(df_reviews, df_bookings):
         except Exception as e:
             # Fallback to manual summary if AI model fails
             st.warning(f"AI model unavailable, using manual summary. Error: {str(e)}")
-            summary = _generate_manual_summary(df_reviews, df_bookings, sentiment_counts, total_revenue, avg_revenue, avg_nights)
+            summary = _generate_manual_summary(df_reviews, df_bookings, sentiment_counts, total_revenue, avg_revenue, avg_nights, segment_counts)
         
         return summary
         
@@ -87,7 +109,7 @@ def generate_summary(df_reviews, df_bookings):
         st.error(f"Summary generation failed: {str(e)}")
         return _generate_manual_summary(df_reviews, df_bookings, {}, 0, 0, 0)
 
-def _generate_manual_summary(df_reviews, df_bookings, sentiment_counts, total_revenue, avg_revenue, avg_nights):
+def _generate_manual_summary(df_reviews, df_bookings, sentiment_counts, total_revenue, avg_revenue, avg_nights, segment_counts=None):
     """
     Generate a manual summary when AI model is unavailable.
     """
@@ -115,12 +137,13 @@ def _generate_manual_summary(df_reviews, df_bookings, sentiment_counts, total_re
             summary_parts.append(f"😊 **Customer Satisfaction**: {satisfaction_rate:.1f}% positive reviews ({positive_count}/{total_reviews}).")
     
     # Segment information
-    if "segment" in df_bookings.columns and len(df_bookings) > 0:
-        segment_counts = df_bookings["segment"].value_counts()
-        if len(segment_counts) > 0:
-            top_segment = segment_counts.index[0]
-            top_segment_count = segment_counts.iloc[0]
-            summary_parts.append(f"👥 **Customer Segments**: Top segment is {top_segment} with {top_segment_count} customers.")
+    if segment_counts is None and "segment" in df_bookings.columns and len(df_bookings) > 0:
+        # Counts were not precomputed by the caller
+        segment_counts = df_bookings["segment"].value_counts().to_dict()
+    if segment_counts:
+        # value_counts orders by frequency, so the first entry is the top segment
+        top_segment, top_segment_count = next(iter(segment_counts.items()))
+        summary_parts.append(f"👥 **Customer Segments**: Top segment is {top_segment} with {top_segment_count} customers.")
     
     # Recommendations based on data
     if len(df_bookings) > 0:
@@ -7,15 +7,62 @@ import numpy as np
 from datetime import datetime, timedelta
 import calendar
 
+# Upper bound on points sent to the browser for per-booking line/scatter traces
+MAX_PLOT_POINTS = 2000
+
+def _downsample(x, y, max_points=MAX_PLOT_POINTS):
+    """Stride-subsample paired arrays to at most max_points, keeping the last point."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= max_points:
+        return x, y
+    idx = np.linspace(0, len(x) - 1, max_points).astype(int)
+    return x[idx], y[idx]
+
+@st.cache_data(show_spinner=False)
+def nights_distribution(nights):
+    """Count bookings per number of nights, indexed by the nights values present."""
+    values = nights.to_numpy()
+    if not np.issubdtype(values.dtype, np.integer):
+        # bincount needs non-negative integers
+        return nights.value_counts().sort_index()
+    # nights is a small non-negative integer, so bincount replaces value_counts + sort_index
+    counts = np.bincount(values)
+    present = np.nonzero(counts)[0]
+    return pd.Series(counts[present], index=present)
+
+def _weighted_sums(codes, weights, minlength=0):
+    """Per-code sums of weights; integer weights give int64 sums, like a pandas groupby sum."""
+    sums = np.bincount(codes, weights=weights, minlength=minlength)
+    if np.issubdtype(weights.dtype, np.integer):
+        # bincount always accumulates in float64, which is exact for these integer totals
+        sums = sums.astype(np.int64)
+    return sums
+
+@st.cache_data(show_spinner=False)
+def _booking_kpis(df_bookings):
+    """Compute booking-level KPIs once per dataframe content."""
+    # One reduction per column; the means are derived from the sums
+    total_bookings = len(df_bookings)
+    total_revenue = df_bookings['total_spent'].to_numpy().sum()
+    total_nights = df_bookings['nights'].to_numpy().sum()
+    return {
+        'total_bookings': total_bookings,
+        'total_nights': total_nights,
+        'avg_nights': total_nights / total_bookings if total_bookings else float('nan'),
+        'total_revenue': total_revenue,
+        'avg_spent_per_night': total_revenue / total_nights if total_nights else float('nan'),
+    }
+
 def create_metrics_cards(df_reviews, df_bookings):
     """Create beautiful metric cards with key performance indicators."""
     
     # Calculate metrics
+    kpis = _booking_kpis(df_bookings)
     total_reviews = len(df_reviews)
-    total_bookings = len(df_bookings)
-    avg_nights = df_bookings['nights'].mean()
-    total_revenue = df_bookings['total_spent'].sum()
-    avg_spent_per_night = df_bookings['total_spent'].sum() / df_bookings['nights'].sum()
+    total_bookings = kpis['total_bookings']
+    avg_nights = kpis['avg_nights']
+    total_revenue = kpis['total_revenue']
     
     # Create metric columns
     col1, col2, col3, col4 = st.columns(4)
@@ -48,13 +95,19 @@ def create_metrics_cards(df_reviews, df_bookings):
             delta=f"${total_revenue//10:,.0f}" if total_revenue > 0 else "$0"
         )
 
+@st.cache_data(show_spinner=False)
+def _sentiment_distribution(sentiments):
+    """Return sentiment counts and their percentage share, computed once per input."""
+    counts = sentiments.value_counts()
+    return counts, counts / len(sentiments) * 100
+
 def create_sentiment_analysis_charts(df_reviews):
     """Create comprehensive sentiment analysis visualizations."""
     
     st.subheader("📝 Sentiment Analysis Dashboard")
     
     # Sentiment distribution pie chart
-    sentiment_counts = df_reviews['sentiment'].value_counts()
+    sentiment_counts, sentiment_pct = _sentiment_distribution(df_reviews['sentiment'])
     
     col1, col2 = st.columns([2, 1])
     
@@ -78,7 +131,7 @@ def create_sentiment_analysis_charts(df_reviews):
         # Sentiment metrics
         st.markdown("### Sentiment Metrics")
         for sentiment, count in sentiment_counts.items():
-            percentage = (count / len(df_reviews)) * 100
+            percentage = sentiment_pct[sentiment]
             color = "🟢" if sentiment == "POSITIVE" else "🔴" if sentiment == "NEGATIVE" else "🟡"
             st.metric(
                 label=f"{color} {sentiment}",
@@ -86,28 +139,40 @@ def create_sentiment_analysis_charts(df_reviews):
                 delta=f"{percentage:.1f}%"
             )
 
+def _highlight_extremes(col):
+    """Style a column's maximum light green and its minimum light coral in one vectorized pass."""
+    values = col.to_numpy()
+    return np.where(
+        values == values.max(), 'background-color: lightgreen',
+        np.where(values == values.min(), 'background-color: lightcoral', '')
+    )
+
 def create_customer_segmentation_charts(df_bookings):
-    """Create comprehensive customer segmentation visualizations."""
+    """
+    Create comprehensive customer segmentation visualizations.
+    Expects a segment column; main.py fills it in from the cached clustering.
+    """
     
     st.subheader("👥 Customer Segmentation Analysis")
     
-    # Ensure segment column exists
-    if "segment" not in df_bookings.columns:
-        from clustering import segment_customers
-        segments = segment_customers(df_bookings)
-        if isinstance(segments, tuple):
-            segments = segments[0]
-        df_bookings["segment"] = segments
-    
     # Segment analysis
-    segment_stats = df_bookings.groupby('segment').agg({
-        'nights': ['mean', 'count'],
-        'total_spent': ['mean', 'sum']
+    # Few segments: integer codes plus bincount aggregate every column in one pass each
+    codes, segment_labels = pd.factorize(df_bookings['segment'], sort=True)
+    # Missing segments get code -1; drop them as groupby does
+    has_segment = codes >= 0
+    codes = codes[has_segment]
+    n_segments = len(segment_labels)
+    counts = np.bincount(codes, minlength=n_segments)
+    nights_sum = _weighted_sums(codes, df_bookings['nights'].to_numpy()[has_segment], n_segments)
+    spent_sum = _weighted_sums(codes, df_bookings['total_spent'].to_numpy()[has_segment], n_segments)
+    segment_stats = pd.DataFrame({
+        'segment': segment_labels,
+        'Avg Nights': nights_sum / counts,
+        'Count': counts,
+        'Avg Spent': spent_sum / counts,
+        'Total Revenue': spent_sum
     }).round(2)
     
-    segment_stats.columns = ['Avg Nights', 'Count', 'Avg Spent', 'Total Revenue']
-    segment_stats = segment_stats.reset_index()
-    
     col1, col2 = st.columns(2)
     
     with col1:
@@ -133,7 +198,8 @@ def create_customer_segmentation_charts(df_bookings):
             title="Nights vs Total Spent by Segment",
             color_discrete_sequence=px.colors.qualitative.Set3,
             size='total_spent',
-            hover_data=['customer_id']
+            hover_data=['customer_id'],
+            render_mode='webgl'
         )
         fig_scatter.update_layout(height=400, xaxis_title="Number of Nights", yaxis_title="Total Spent ($)")
         st.plotly_chart(fig_scatter, use_container_width=True)
@@ -141,51 +207,79 @@ def create_customer_segmentation_charts(df_bookings):
     # Segment statistics table
     st.markdown("### 📊 Segment Statistics")
     st.dataframe(
-        segment_stats.style.highlight_max(axis=0, color='lightgreen').highlight_min(axis=0, color='lightcoral'),
+        segment_stats.style.apply(
+            _highlight_extremes,
+            subset=['Avg Nights', 'Count', 'Avg Spent', 'Total Revenue']
+        ),
         use_container_width=True
     )
 
-def create_revenue_analysis_charts(df_bookings):
-    """Create comprehensive revenue analysis visualizations."""
+@st.cache_data(show_spinner=False)
+def _revenue_trace_data(df_bookings):
+    """Compute the x/y data of the four revenue traces, in subplot order."""
+    spent = df_bookings['total_spent'].to_numpy()
+    nights = df_bookings['nights'].to_numpy()
     
-    st.subheader("💰 Revenue Analysis Dashboard")
-    
-    # Create subplots for different revenue metrics
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Revenue Distribution', 'Revenue by Nights', 'Cumulative Revenue', 'Revenue Trends')
-    )
-    
-    # Revenue distribution histogram
-    fig.add_trace(
-        go.Histogram(x=df_bookings['total_spent'], name='Revenue Distribution', nbinsx=20),
-        row=1, col=1
-    )
+    # Revenue distribution histogram, binned server-side
+    counts, edges = np.histogram(spent, bins=20)
     
     # Revenue by nights
-    nights_revenue = df_bookings.groupby('nights')['total_spent'].sum().reset_index()
-    fig.add_trace(
-        go.Bar(x=nights_revenue['nights'], y=nights_revenue['total_spent'], name='Revenue by Nights'),
-        row=1, col=2
-    )
+    # nights is a small non-negative integer, so a weighted bincount is the groupby-sum
+    revenue_per_nights = _weighted_sums(nights, spent)
+    nights_present = nights_distribution(df_bookings['nights']).index.to_numpy()
     
     # Cumulative revenue
-    sorted_bookings = df_bookings.sort_values('total_spent')
-    cumulative_revenue = sorted_bookings['total_spent'].cumsum()
-    fig.add_trace(
-        go.Scatter(x=sorted_bookings['total_spent'], y=cumulative_revenue, name='Cumulative Revenue'),
-        row=2, col=1
-    )
+    sorted_spent = np.sort(spent)
+    cum_x, cum_y = _downsample(sorted_spent, np.cumsum(sorted_spent))
     
     # Revenue trends (assuming customer_id represents time order)
-    fig.add_trace(
-        go.Scatter(x=df_bookings['customer_id'], y=df_bookings['total_spent'], name='Revenue Trends'),
-        row=2, col=2
-    )
+    trend_x, trend_y = _downsample(df_bookings['customer_id'], spent)
+    
+    return [
+        {'x': (edges[:-1] + edges[1:]) / 2, 'y': counts, 'width': np.diff(edges)},
+        {'x': nights_present, 'y': revenue_per_nights[nights_present]},
+        {'x': cum_x, 'y': cum_y},
+        {'x': trend_x, 'y': trend_y},
+    ]
+
+def create_revenue_analysis_charts(df_bookings):
+    """Create comprehensive revenue analysis visualizations."""
+    
+    st.subheader("💰 Revenue Analysis Dashboard")
+    
+    trace_data = _revenue_trace_data(df_bookings)
+    
+    # Build the figure once per session; later reruns only swap the trace data
+    fig = st.session_state.get('revenue_fig')
+    if fig is None:
+        # Create subplots for different revenue metrics
+        fig = make_subplots(
+            rows=2, cols=2,
+            subplot_titles=('Revenue Distribution', 'Revenue by Nights', 'Cumulative Revenue', 'Revenue Trends')
+        )
+        fig.add_trace(go.Bar(name='Revenue Distribution', **trace_data[0]), row=1, col=1)
+        fig.add_trace(go.Bar(name='Revenue by Nights', **trace_data[1]), row=1, col=2)
+        fig.add_trace(go.Scatter(name='Cumulative Revenue', **trace_data[2]), row=2, col=1)
+        fig.add_trace(go.Scatter(name='Revenue Trends', **trace_data[3]), row=2, col=2)
+        fig.update_layout(height=600, title_text="Revenue Analysis Overview")
+        st.session_state['revenue_fig'] = fig
+    else:
+        for trace, data in zip(fig.data, trace_data):
+            trace.update(**data)
     
-    fig.update_layout(height=600, title_text="Revenue Analysis Overview")
     st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(show_spinner=False)
+def _booking_derived(df_bookings):
+    """Compute the nights/spend correlation and the top-revenue booking in one cached pass."""
+    cols = ['nights', 'total_spent']
+    corr = np.corrcoef(df_bookings['nights'].to_numpy(), df_bookings['total_spent'].to_numpy())
+    top_idx = df_bookings['total_spent'].to_numpy().argmax()
+    return {
+        'corr': pd.DataFrame(corr, index=cols, columns=cols),
+        'top': df_bookings.iloc[top_idx],
+    }
+
 def create_booking_patterns_charts(df_bookings):
     """Create booking patterns and trends visualizations."""
     
@@ -194,12 +288,12 @@ def create_booking_patterns_charts(df_bookings):
     col1, col2 = st.columns(2)
     
     with col1:
-        # Nights distribution
-        fig_nights = px.histogram(
-            df_bookings,
-            x='nights',
+        # Nights distribution, counted server-side
+        nights_dist = nights_distribution(df_bookings['nights'])
+        fig_nights = px.bar(
+            x=nights_dist.index,
+            y=nights_dist.to_numpy(),
             title="Distribution of Booking Durations",
-            nbins=10,
             color_discrete_sequence=['#636EFA']
         )
         fig_nights.update_layout(height=400, xaxis_title="Number of Nights", yaxis_title="Frequency")
@@ -220,7 +314,7 @@ def create_booking_patterns_charts(df_bookings):
     st.markdown("### 🔍 Advanced Patterns")
     
     # Create correlation heatmap
-    correlation_matrix = df_bookings[['nights', 'total_spent']].corr()
+    correlation_matrix = _booking_derived(df_bookings)['corr']
     
     fig_heatmap = px.imshow(
         correlation_matrix,
@@ -276,18 +370,37 @@ def create_interactive_filters(df_reviews, df_bookings):
             default=segments.tolist()
         )
     
-    # Apply filters
-    filtered_bookings = df_bookings[
-        (df_bookings['nights'] >= nights_range[0]) &
-        (df_bookings['nights'] <= nights_range[1]) &
-        (df_bookings['total_spent'] >= revenue_range[0]) &
-        (df_bookings['total_spent'] <= revenue_range[1])
-    ]
+    # Apply filters: build one boolean mask over the raw arrays, then index once
+    nights = df_bookings['nights'].to_numpy()
+    spent = df_bookings['total_spent'].to_numpy()
+    mask = (nights >= nights_range[0]) & (nights <= nights_range[1])
+    mask &= (spent >= revenue_range[0]) & (spent <= revenue_range[1])
     
     if 'selected_segments' in locals():
-        filtered_bookings = filtered_bookings[filtered_bookings['segment'].isin(selected_segments)]
+        mask &= df_bookings['segment'].isin(selected_segments).to_numpy()
     
-    return filtered_bookings
+    return df_bookings[mask]
+
+@st.cache_data(show_spinner=False)
+def _summary_insights(df_reviews, df_bookings):
+    """Gather every figure shown in the key insights panel in one cached call."""
+    kpis = _booking_kpis(df_bookings)
+    insights = {
+        'total_revenue': kpis['total_revenue'],
+        'avg_nights': kpis['avg_nights'],
+        'avg_spent_per_night': kpis['avg_spent_per_night'],
+        'top_booking': _booking_derived(df_bookings)['top'],
+    }
+    
+    # Sentiment insights: a single value_counts instead of one mask per label
+    if 'sentiment' in df_reviews.columns:
+        sentiment_counts = df_reviews['sentiment'].value_counts()
+        positive_reviews = int(sentiment_counts.get('POSITIVE', 0))
+        insights['positive_reviews'] = positive_reviews
+        insights['negative_reviews'] = int(sentiment_counts.get('NEGATIVE', 0))
+        insights['satisfaction_rate'] = (positive_reviews / len(df_reviews)) * 100 if len(df_reviews) > 0 else 0
+    
+    return insights
 
 def create_summary_insights(df_reviews, df_bookings):
     """Create summary insights and key takeaways."""
@@ -295,28 +408,20 @@ def create_summary_insights(df_reviews, df_bookings):
     st.subheader("💡 Key Insights & Takeaways")
     
     # Calculate insights
-    total_revenue = df_bookings['total_spent'].sum()
-    avg_nights = df_bookings['nights'].mean()
-    avg_spent_per_night = df_bookings['total_spent'].sum() / df_bookings['nights'].sum()
-    
-    # Sentiment insights
-    if 'sentiment' in df_reviews.columns:
-        positive_reviews = len(df_reviews[df_reviews['sentiment'] == 'POSITIVE'])
-        negative_reviews = len(df_reviews[df_reviews['sentiment'] == 'NEGATIVE'])
-        satisfaction_rate = (positive_reviews / len(df_reviews)) * 100 if len(df_reviews) > 0 else 0
+    insights = _summary_insights(df_reviews, df_bookings)
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.info(f"**Revenue Insights**\n\n💰 Total Revenue: ${total_revenue:,.0f}\n🌙 Avg Nights: {avg_nights:.1f}\n💸 Avg per Night: ${avg_spent_per_night:.0f}")
+        st.info(f"**Revenue Insights**\n\n💰 Total Revenue: ${insights['total_revenue']:,.0f}\n🌙 Avg Nights: {insights['avg_nights']:.1f}\n💸 Avg per Night: ${insights['avg_spent_per_night']:.0f}")
     
     with col2:
-        if 'sentiment' in df_reviews.columns:
-            st.success(f"**Customer Satisfaction**\n\n😊 Positive: {positive_reviews}\n😞 Negative: {negative_reviews}\n📈 Rate: {satisfaction_rate:.1f}%")
+        if 'positive_reviews' in insights:
+            st.success(f"**Customer Satisfaction**\n\n😊 Positive: {insights['positive_reviews']}\n😞 Negative: {insights['negative_reviews']}\n📈 Rate: {insights['satisfaction_rate']:.1f}%")
     
     with col3:
         # Top performing metrics
-        top_revenue_booking = df_bookings.loc[df_bookings['total_spent'].idxmax()]
+        top_revenue_booking = insights['top_booking']
         st.warning(f"**Top Performance**\n\n🏆 Highest Revenue: ${top_revenue_booking['total_spent']:,.0f}\n👤 Customer ID: {top_revenue_booking['customer_id']}\n🌙 Nights: {top_revenue_booking['nights']}")
 
 def apply_custom_css():
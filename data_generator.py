@@ -7,125 +7,123 @@ Creates realistic sample data for demonstration purposes.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
+
+# Sample review pools, built once at import time
+POSITIVE_REVIEWS = np.array([
+    "Excellent service and very clean rooms!",
+    "Amazing location and friendly staff.",
+    "Great value for money, highly recommended!",
+    "Perfect stay, will definitely return.",
+    "Outstanding hospitality and beautiful facilities.",
+    "Staff went above and beyond expectations.",
+    "Clean, comfortable, and convenient location.",
+    "Wonderful experience, exceeded all expectations.",
+    "Professional service and excellent amenities.",
+    "Best hotel experience I've had in years!"
+])
+
+NEGATIVE_REVIEWS = np.array([
+    "Poor service and dirty rooms.",
+    "Staff was rude and unhelpful.",
+    "Overpriced for what you get.",
+    "Noisy and uncomfortable beds.",
+    "Terrible customer service experience.",
+    "Room was not clean upon arrival.",
+    "Staff ignored our complaints.",
+    "Facilities were outdated and broken.",
+    "Worst hotel experience ever.",
+    "Don't waste your money here."
+])
+
+NEUTRAL_REVIEWS = np.array([
+    "Average experience, nothing special.",
+    "Room was okay, service was standard.",
+    "Met basic expectations, nothing more.",
+    "Decent place to stay for the night.",
+    "Standard hotel with standard service.",
+    "Not bad, but not great either.",
+    "Basic amenities, basic experience.",
+    "Satisfactory for a business trip.",
+    "Mediocre service and facilities.",
+    "Acceptable but forgettable stay."
+])
+
+SENTIMENT_LABELS = ('POSITIVE', 'NEGATIVE', 'NEUTRAL')
+SENTIMENT_P = np.array([0.6, 0.2, 0.2])
+BASE_PRICES = np.array([80, 120, 200, 350])
+BASE_PRICE_P = np.array([0.4, 0.35, 0.2, 0.05])
+SEGMENT_BINS = (-np.inf, 100, 150, 250, np.inf)
+SEGMENT_LABELS = ('Budget', 'Standard', 'Premium', 'Luxury')
 
 def generate_sample_data():
     """Generate realistic sample data for hotel analytics."""
     
     # Set random seed for reproducibility
     np.random.seed(42)
-    random.seed(42)
     
-    # Generate sample reviews
-    positive_reviews = [
-        "Excellent service and very clean rooms!",
-        "Amazing location and friendly staff.",
-        "Great value for money, highly recommended!",
-        "Perfect stay, will definitely return.",
-        "Outstanding hospitality and beautiful facilities.",
-        "Staff went above and beyond expectations.",
-        "Clean, comfortable, and convenient location.",
-        "Wonderful experience, exceeded all expectations.",
-        "Professional service and excellent amenities.",
-        "Best hotel experience I've had in years!"
-    ]
+    # Generate 100 reviews with realistic sentiment distribution
+    n_reviews = 100
+    sentiment_idx = np.random.choice(len(SENTIMENT_LABELS), size=n_reviews, p=SENTIMENT_P)
     
-    negative_reviews = [
-        "Poor service and dirty rooms.",
-        "Staff was rude and unhelpful.",
-        "Overpriced for what you get.",
-        "Noisy and uncomfortable beds.",
-        "Terrible customer service experience.",
-        "Room was not clean upon arrival.",
-        "Staff ignored our complaints.",
-        "Facilities were outdated and broken.",
-        "Worst hotel experience ever.",
-        "Don't waste your money here."
-    ]
+    # Draw a candidate review from each pool, then keep the one matching the sentiment
+    review_pools = (POSITIVE_REVIEWS, NEGATIVE_REVIEWS, NEUTRAL_REVIEWS)
+    candidates = np.stack([pool[np.random.randint(len(pool), size=n_reviews)] for pool in review_pools])
+    reviews = candidates[sentiment_idx, np.arange(n_reviews)]
     
-    neutral_reviews = [
-        "Average experience, nothing special.",
-        "Room was okay, service was standard.",
-        "Met basic expectations, nothing more.",
-        "Decent place to stay for the night.",
-        "Standard hotel with standard service.",
-        "Not bad, but not great either.",
-        "Basic amenities, basic experience.",
-        "Satisfactory for a business trip.",
-        "Mediocre service and facilities.",
-        "Acceptable but forgettable stay."
-    ]
+    # Generate 200 bookings with realistic patterns
+    n_bookings = 200
     
-    # Generate 100 reviews with realistic sentiment distribution
-    reviews_data = []
-    for i in range(100):
-        sentiment_choice = np.random.choice(['POSITIVE', 'NEGATIVE', 'NEUTRAL'], p=[0.6, 0.2, 0.2])
-        
-        if sentiment_choice == 'POSITIVE':
-            review = random.choice(positive_reviews)
-        elif sentiment_choice == 'NEGATIVE':
-            review = random.choice(negative_reviews)
-        else:
-            review = random.choice(neutral_reviews)
-        
-        reviews_data.append({
-            'review': review,
-            'sentiment': sentiment_choice
-        })
+    # Generate realistic nights (1-7 nights)
+    # Use uniform distribution to avoid probability issues
+    nights = np.random.randint(1, 8, size=n_bookings)
     
-    # Generate 200 bookings with realistic patterns
-    bookings_data = []
+    # Generate realistic spending based on nights and segment
+    base_price_per_night = np.random.choice(BASE_PRICES, size=n_bookings, p=BASE_PRICE_P)
+    
+    # Add some variation
+    price_variation = np.random.normal(1, 0.2, size=n_bookings)
+    total_spent = (base_price_per_night * nights * price_variation).astype(int)
     
-    # Create different customer segments
-    segments = ['Budget', 'Standard', 'Premium', 'Luxury']
+    # Ensure minimum reasonable price
+    total_spent = np.maximum(total_spent, 50 * nights)
     
-    for i in range(200):
-        # Generate realistic nights (1-7 nights, weighted towards shorter stays)
-        # Use uniform distribution to avoid probability issues
-        nights = np.random.randint(1, 8)
-        
-        # Generate realistic spending based on nights and segment
-        base_price_per_night = np.random.choice([80, 120, 200, 350], p=[0.4, 0.35, 0.2, 0.05])
-        
-        # Add some variation
-        price_variation = np.random.normal(1, 0.2)
-        total_spent = int(base_price_per_night * nights * price_variation)
-        
-        # Ensure minimum reasonable price
-        total_spent = max(total_spent, 50 * nights)
-        
-        # Assign segment based on spending
-        if total_spent / nights < 100:
-            segment = 'Budget'
-        elif total_spent / nights < 150:
-            segment = 'Standard'
-        elif total_spent / nights < 250:
-            segment = 'Premium'
-        else:
-            segment = 'Luxury'
-        
-        bookings_data.append({
-            'customer_id': i + 1,
-            'nights': nights,
-            'total_spent': total_spent,
-            'segment': segment,
-            'price_per_night': round(total_spent / nights, 2)
-        })
+    # Assign segment based on spending
+    spent_per_night = total_spent / nights
+    # right=False keeps the thresholds exclusive (< 100 is Budget, 100 is Standard)
+    segment = pd.cut(
+        spent_per_night,
+        bins=SEGMENT_BINS,
+        labels=SEGMENT_LABELS,
+        right=False
+    )
     
     # Create DataFrames
-    df_reviews = pd.DataFrame(reviews_data)
-    df_bookings = pd.DataFrame(bookings_data)
+    df_reviews = pd.DataFrame({
+        'review': reviews,
+        # Categorical: stored as int8 codes instead of one string object per row
+        'sentiment': pd.Categorical.from_codes(sentiment_idx, categories=SENTIMENT_LABELS)
+    })
+    # Narrow dtypes: every value fits, and smaller columns mean fewer bytes per scan
+    df_bookings = pd.DataFrame({
+        'customer_id': np.arange(1, n_bookings + 1, dtype=np.int32),
+        'nights': nights.astype(np.int8),
+        'total_spent': total_spent.astype(np.int32),
+        'segment': segment,
+        # float64: float32 cannot hold the 2-decimal rounding exactly (65.86 -> 65.860001)
+        'price_per_night': np.round(spent_per_night, 2)
+    })
     
     return df_reviews, df_bookings
 
 def save_sample_data():
-    """Save generated sample data to CSV files."""
+    """Save generated sample data to Parquet files."""
     
     df_reviews, df_bookings = generate_sample_data()
     
     # Save to data directory
-    df_reviews.to_csv('data/reviews.csv', index=False)
-    df_bookings.to_csv('data/bookings.csv', index=False)
+    # Parquet is typed and columnar, so categoricals and narrow dtypes survive the round trip
+    df_reviews.to_parquet('data/reviews.parquet', engine='pyarrow', compression='zstd', index=False)
+    df_bookings.to_parquet('data/bookings.parquet', engine='pyarrow', compression='zstd', index=False)
     
     print("✅ Sample data generated successfully!")
     print(f"📝 Reviews: {len(df_reviews)} records")
@@ -9,10 +9,10 @@ import sys
 import platform
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (an argv list, no shell) and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -31,30 +31,32 @@ def main():
     print(f"✅ Python {sys.version} detected")
     
     # Upgrade pip
-    if not run_command(f"{sys.executable} -m pip install --upgrade pip", "Upgrading pip"):
+    pip_install = [sys.executable, "-m", "pip", "install"]
+    if not run_command(pip_install + ["--upgrade", "pip"], "Upgrading pip"):
         sys.exit(1)
     
     # Install PyTorch first (this is the key fix)
-    pytorch_command = f"{sys.executable} -m pip install torch torchvision torchaudio --index-url https://download.pytorch.org/whl/cpu"
+    pytorch_command = pip_install + ["torch", "torchvision", "torchaudio", "--index-url", "https://download.pytorch.org/whl/cpu"]
     if not run_command(pytorch_command, "Installing PyTorch"):
         print("⚠️  PyTorch installation failed. Trying alternative method...")
         # Fallback to regular torch installation
-        if not run_command(f"{sys.executable} -m pip install torch", "Installing PyTorch (fallback)"):
+        if not run_command(pip_install + ["torch"], "Installing PyTorch (fallback)"):
             sys.exit(1)
     
     # Install other dependencies
     dependencies = [
         "streamlit>=1.28.0",
-        "pandas>=2.0.0", 
+        "pandas>=2.1.0", 
+        "pyarrow>=10.0.0",
         "scikit-learn>=1.3.0",
         "transformers>=4.30.0",
         "plotly>=5.15.0",
         "numpy>=1.21.0"
     ]
     
-    for dep in dependencies:
-        if not run_command(f"{sys.executable} -m pip install {dep}", f"Installing {dep}"):
-            sys.exit(1)
+    # A single pip call resolves and downloads everything in one process
+    if not run_command(pip_install + dependencies, "Installing dependencies"):
+        sys.exit(1)
     
     print("\n🎉 Installation completed successfully!")
     print("\nTo run the application:")